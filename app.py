@@ -1,36 +1,57 @@
 #!/usr/bin/env python3
-import subprocess
+import os
+import sys
+from types import MappingProxyType
+
+# Opt-in: leave a previously synthesized cloud assembly in place rather than
+# rebuilding the stack, e.g. for repeated `cdk ls`/`cdk diff` runs.
+_reuse_manifest = os.path.join(os.environ.get("CDK_OUTDIR", "cdk.out"), "manifest.json")
+if os.environ.get("CDK_REUSE_ASSEMBLY") == "1" and os.path.exists(_reuse_manifest):
+    print(
+        f"CDK_REUSE_ASSEMBLY is set, reusing existing cloud assembly {_reuse_manifest} "
+        "without re-synthesizing",
+        file=sys.stderr,
+    )
+    sys.exit(0)
 
-import aws_cdk as cdk
+from config import auth_app_settings  # noqa: E402
+from git_info import get_git_meta  # noqa: E402
 
-from infra.stack import AuthStack, BucketPermissions
-from config import auth_app_settings
+# Fail on missing configuration before paying for the aws_cdk/jsii import below.
+if not auth_app_settings.project_prefix:
+    sys.exit("PROJECT_PREFIX must be set in the environment or .env file")
 
-git_sha = subprocess.check_output(["git", "rev-parse", "HEAD"]).decode().strip()
-try:
-    git_tag = subprocess.check_output(["git", "describe", "--tags"]).decode().strip()
-except subprocess.CalledProcessError:
-    git_tag = "no-tag"
+git_meta = get_git_meta()
 proj_prefix = auth_app_settings.project_prefix
+project_name = proj_prefix.upper()
+stage = auth_app_settings.stage
+qualifier = auth_app_settings.cdk_qualifier
 app_name = f"{proj_prefix}-{auth_app_settings.app_name}"
 tags = {
 
     "Project": proj_prefix,
     "Owner": auth_app_settings.owner,
     "Client": "nasa-impact",
-    "Stack": auth_app_settings.stage,
-    "GitCommit": git_sha,
-    "GitTag": git_tag,
+    "Stack": stage,
+    "GitCommit": git_meta["sha"],
+    "GitTag": git_meta["tag"],
 }
 
-app = cdk.App()
-stack_name = f"{app_name}-{auth_app_settings.stage}"
+# Nothing here reads construct creation stacks, skip capturing one per construct.
+os.environ.setdefault("CDK_DISABLE_STACK_TRACE", "1")
+
+import aws_cdk as cdk  # noqa: E402
+
+from infra.stack import AuthStack, BucketPermissions  # noqa: E402
+
+app = cdk.App(context={"aws:cdk:disable-stack-trace": True})
+stack_name = f"{app_name}-{stage}"
 stack = AuthStack(
     app,
     stack_name,
     auth_app_settings,
     synthesizer=cdk.DefaultStackSynthesizer(
-        qualifier=auth_app_settings.cdk_qualifier
+        qualifier=qualifier
 ))
 
 
@@ -39,61 +60,63 @@ if data_managers_role_arn := auth_app_settings.data_managers_role_arn:
     stack.add_cognito_group_with_existing_role(
 
         f"{proj_prefix}-data-store-managers",
-        f"Authenticated users assume read write {proj_prefix.upper()} data access role",
+        f"Authenticated users assume read write {project_name} data access role",
         role_arn=data_managers_role_arn,
     )
 
 # Create Groups
 
-if auth_app_settings.cognito_groups:
-    stack.add_cognito_group(
-        f"{proj_prefix}-staging-writers",
-        "Users that have read/write-access to the GHGC store and staging datastore",
-        {
-            f"{proj_prefix}-data-store-dev": BucketPermissions.read_write,
-            f"{proj_prefix}-data-store": BucketPermissions.read_write,
-            f"{proj_prefix}-data-store-staging": BucketPermissions.read_write,
-        },
-    )
-    stack.add_cognito_group(
-        f"{proj_prefix}-writers",
-        "Users that have read/write-access to the GHGC store",
-        {
-            f"{proj_prefix}-data-store-dev": BucketPermissions.read_write,
-            f"{proj_prefix}-data-store": BucketPermissions.read_write,
-        },
-    )
-
-
-    stack.add_cognito_group(
-        f"{proj_prefix}-staging-readers",
-        "Users that have read-access to the GHGC store and staging data store",
-        {
-            f"{proj_prefix}-data-store-dev": BucketPermissions.read_only,
-            f"{proj_prefix}-data-store": BucketPermissions.read_only,
-            f"{proj_prefix}-data-store-staging": BucketPermissions.read_only,
-        },
-    )
+_RW = BucketPermissions.read_write
+_RO = BucketPermissions.read_only
+dev_bucket = f"{proj_prefix}-data-store-dev"
+bucket = f"{proj_prefix}-data-store"
+staging_bucket = f"{proj_prefix}-data-store-staging"
+
+# Groups are created in order, earlier groups take precedence.
+GROUP_SPECS = [
+    (
+        "staging-writers",
+        f"Users that have read/write-access to the {project_name} store and staging datastore",
+        MappingProxyType({dev_bucket: _RW, bucket: _RW, staging_bucket: _RW}),
+    ),
+    (
+        "writers",
+        f"Users that have read/write-access to the {project_name} store",
+        MappingProxyType({dev_bucket: _RW, bucket: _RW}),
+    ),
+    (
+        "staging-readers",
+        f"Users that have read-access to the {project_name} store and staging data store",
+        MappingProxyType({dev_bucket: _RO, bucket: _RO, staging_bucket: _RO}),
+    ),
     # TODO: Should this be the default IAM role for the user group?
-    stack.add_cognito_group(
-        f"{proj_prefix}-readers",
-        "Users that have read-access to the GHGC store",
-        {
-            f"{proj_prefix}-data-store": BucketPermissions.read_only,
-        },
-    )
+    (
+        "readers",
+        f"Users that have read-access to the {project_name} store",
+        MappingProxyType({bucket: _RO}),
+    ),
+]
+
+if auth_app_settings.cognito_groups:
+    for name, description, bucket_permissions in GROUP_SPECS:
+        stack.add_cognito_group(
+            f"{proj_prefix}-{name}", description, bucket_permissions
+        )
 
 
 # Generate a resource server (ie something to protect behind auth) with scopes
 # (permissions that we can grant to users/services).
-stac_registry_scopes = stack.add_resource_server(
-
-    f"{proj_prefix}-stac-ingestion-registry",
-    supported_scopes={
+STAC_SCOPES = MappingProxyType(
+    {
         "stac:register": "Create STAC ingestions",
         "stac:cancel": "Cancel a STAC ingestion",
         "stac:list": "Cancel a STAC ingestion",
-    },
+    }
+)
+stac_registry_scopes = stack.add_resource_server(
+
+    f"{proj_prefix}-stac-ingestion-registry",
+    supported_scopes=STAC_SCOPES,
 )
 
 
@@ -110,13 +133,11 @@ stack.add_service_client(
 
 # Generate an OIDC provider, allowing CI workers to assume roles in the account
 
-oidc_thumbprint = auth_app_settings.oidc_thumbprint
-oidc_provider_url = auth_app_settings.oidc_provider_url
-if oidc_thumbprint and oidc_provider_url:
+if (oidc_provider_url := auth_app_settings.oidc_provider_url) and (
+    oidc_thumbprint := auth_app_settings.oidc_thumbprint
+):
     stack.add_oidc_provider(
-
-
-        f"{proj_prefix}-oidc-provider-{auth_app_settings.stage}",
+        f"{proj_prefix}-oidc-provider-{stage}",
         oidc_provider_url,
         oidc_thumbprint,
     )
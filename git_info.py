@@ -0,0 +1,147 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+GIT_DIR = Path(__file__).resolve().parent / ".git"
+
+
+def _read_git_head() -> Optional[str]:
+    """
+    Resolve HEAD to a commit SHA by reading the git metadata files directly,
+    returning None if the layout isn't one we understand (e.g. worktrees).
+    """
+    try:
+        head = (GIT_DIR / "HEAD").read_text().strip()
+    except OSError:
+        return None
+
+    if not head.startswith("ref: "):
+        return head
+
+    ref = head[len("ref: "):]
+    try:
+        return (GIT_DIR / ref).read_text().strip()
+    except OSError:
+        pass
+
+    try:
+        packed_refs = (GIT_DIR / "packed-refs").read_text()
+    except OSError:
+        return None
+    for line in packed_refs.splitlines():
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
+
+
+def _tag_state() -> Optional[str]:
+    """
+    Fingerprint of the repository's tags, built from the modification times of
+    packed-refs and everything under refs/tags. Returns None if the tags can't be
+    inspected (e.g. `.git` is a file in worktrees and submodules), in which case
+    the described tag must not be cached.
+    """
+    if not GIT_DIR.is_dir():
+        return None
+
+    paths = [
+        path
+        for path in (GIT_DIR / "packed-refs", GIT_DIR / "refs" / "tags")
+        if path.exists()
+    ]
+    if not paths:
+        return None
+
+    try:
+        if (GIT_DIR / "refs" / "tags").is_dir():
+            paths.extend((GIT_DIR / "refs" / "tags").rglob("*"))
+        mtimes = [path.stat().st_mtime_ns for path in paths]
+    except OSError:
+        return None
+    return f"{len(mtimes)}-{max(mtimes)}"
+
+
+@lru_cache(maxsize=None)
+def _git_executable() -> Optional[str]:
+    return shutil.which("git")
+
+
+def _warn(message: str) -> None:
+    print(f"warning: {message}", file=sys.stderr)
+
+
+def _run_git(*args: str) -> Optional[str]:
+    """
+    Run a git command, returning its output or None if git is unavailable, fails,
+    or doesn't answer within a couple of seconds.
+    """
+    git = _git_executable()
+    if git is None:
+        _warn("git executable not found")
+        return None
+    try:
+        result = subprocess.run(
+            [git, *args], check=False, capture_output=True, timeout=2
+        )
+    except subprocess.TimeoutExpired:
+        _warn(f"`git {' '.join(args)}` timed out")
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.decode().strip()
+
+
+def get_git_meta() -> Dict[str, str]:
+    """
+    Commit SHA and tag used to tag the stack. Values exported by CI via GIT_SHA and
+    GIT_TAG take precedence, git is only spawned for whatever is left unresolved.
+
+    The tag is described from the local HEAD and cached in the cdk output
+    directory, keyed by that HEAD and the state of the repository's tags, so
+    re-synthesizing the same commit skips `git describe`.
+    """
+    head_sha = _read_git_head()
+    git_sha = os.environ.get("GIT_SHA") or head_sha or _run_git("rev-parse", "HEAD")
+    if not git_sha:
+        raise RuntimeError("Unable to determine git commit, set GIT_SHA")
+
+    git_tag = os.environ.get("GIT_TAG")
+    if git_tag:
+        return {"sha": git_sha, "tag": git_tag}
+
+    cache_path = Path(os.environ.get("CDK_OUTDIR", "cdk.out")) / ".gitmeta.json"
+    tag_state = _tag_state() if head_sha else None
+    if tag_state:
+        try:
+            cached = json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            cached = {}
+        if (
+            cached.get("sha") == head_sha
+            and cached.get("tag_state") == tag_state
+            and cached.get("tag")
+        ):
+            return {"sha": git_sha, "tag": cached["tag"]}
+
+    git_tag = _run_git("describe", "--tags")
+    if git_tag is None:
+        # No tag, or git is missing/hung: don't let that outcome stick to this SHA.
+        _warn("unable to describe HEAD, tagging stack with GitTag=no-tag (set GIT_TAG to override)")
+        return {"sha": git_sha, "tag": "no-tag"}
+
+    if tag_state:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(
+                json.dumps({"sha": head_sha, "tag_state": tag_state, "tag": git_tag})
+            )
+        except OSError:
+            pass
+
+    return {"sha": git_sha, "tag": git_tag}
@@ -1,6 +1,6 @@
 import json
 from enum import Enum
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, Mapping, Optional, Sequence
 
 from aws_cdk import CfnOutput, RemovalPolicy, SecretValue, Stack
 from aws_cdk import aws_cognito as cognito
@@ -26,6 +26,8 @@ class AuthStack(Stack):
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
+        self.auth_app_settings = auth_app_settings
+
         if auth_app_settings.permissions_boundary_policy_name:
             permission_boundary_policy = iam.ManagedPolicy.from_managed_policy_name(
                 self,
@@ -158,7 +160,7 @@ class AuthStack(Stack):
         domain = userpool.add_domain(
             "cognito-domain",
             cognito_domain=cognito.CognitoDomainOptions(
-                domain_prefix=f"{AuthConfig().project_prefix}-{stack_name}"
+                domain_prefix=f"{self.auth_app_settings.project_prefix}-{stack_name}"
             ),
         )
 
@@ -279,7 +281,7 @@ class AuthStack(Stack):
     def add_resource_server(
             self,
             resource_id: str,
-            supported_scopes: Dict[str, str],
+            supported_scopes: Mapping[str, str],
     ) -> Dict[str, cognito.OAuthScope]:
         """
         The resource server represents something that a client would like to be able to
@@ -381,7 +383,7 @@ class AuthStack(Stack):
             self,
             group_name: str,
             description: str,
-            bucket_permissions: Dict[str, BucketPermissions],
+            bucket_permissions: Mapping[str, BucketPermissions],
     ) -> cognito.CfnUserPoolGroup:
         role = iam.Role(
             self,
@@ -0,0 +1,103 @@
+import json
+import subprocess
+
+import pytest
+
+import git_info
+
+
+def _git(*args, cwd):
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _commit(cwd, message="commit"):
+    _git("commit", "--allow-empty", "-m", message, cwd=cwd)
+    return _git("rev-parse", "HEAD", cwd=cwd)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """
+    Empty git repository used as the working directory, with git_info pointed at it.
+    """
+    for var in ("GIT_SHA", "GIT_TAG"):
+        monkeypatch.delenv(var, raising=False)
+    for var in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{var}_NAME", "test")
+        monkeypatch.setenv(f"GIT_{var}_EMAIL", "test@example.com")
+    monkeypatch.setenv("CDK_OUTDIR", str(tmp_path / "cdk.out"))
+
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git("init", "-q", cwd=path)
+    monkeypatch.chdir(path)
+    monkeypatch.setattr(git_info, "GIT_DIR", path / ".git")
+    return path
+
+
+def _cached(tmp_path):
+    return json.loads((tmp_path / "cdk.out" / ".gitmeta.json").read_text())
+
+
+def test_tagging_head_invalidates_cached_tag(repo, tmp_path):
+    _commit(repo)
+    _git("tag", "v0", cwd=repo)
+    sha = _commit(repo)
+
+    meta = git_info.get_git_meta()
+    assert meta["sha"] == sha
+    assert meta["tag"].startswith("v0-1-g")
+    assert _cached(tmp_path)["tag"] == meta["tag"]
+
+    _git("tag", "v1", cwd=repo)
+    assert git_info.get_git_meta() == {"sha": sha, "tag": "v1"}
+
+
+def test_packed_and_deleted_tags_invalidate_cached_tag(repo):
+    _commit(repo)
+    _git("tag", "v0", cwd=repo)
+    _commit(repo)
+    _git("tag", "nested/v1", cwd=repo)
+    assert git_info.get_git_meta()["tag"] == "nested/v1"
+
+    _git("pack-refs", "--all", cwd=repo)
+    _git("tag", "-d", "nested/v1", cwd=repo)
+    assert git_info.get_git_meta()["tag"].startswith("v0-1-g")
+
+
+def test_fallback_tag_is_not_cached(repo, tmp_path, capsys):
+    sha = _commit(repo)
+
+    assert git_info.get_git_meta() == {"sha": sha, "tag": "no-tag"}
+    assert not (tmp_path / "cdk.out" / ".gitmeta.json").exists()
+    assert "GitTag=no-tag" in capsys.readouterr().err
+
+    _git("tag", "v1", cwd=repo)
+    assert git_info.get_git_meta() == {"sha": sha, "tag": "v1"}
+
+
+def test_worktree_is_not_cached(repo, tmp_path, monkeypatch):
+    _commit(repo)
+    _git("tag", "v0", cwd=repo)
+    worktree = tmp_path / "worktree"
+    _git("worktree", "add", "-q", "-b", "wt", str(worktree), cwd=repo)
+    sha = _commit(worktree)
+    monkeypatch.chdir(worktree)
+    monkeypatch.setattr(git_info, "GIT_DIR", worktree / ".git")
+
+    assert git_info._tag_state() is None
+    assert git_info.get_git_meta()["tag"].startswith("v0-1-g")
+
+    _git("tag", "v1", cwd=worktree)
+    assert git_info.get_git_meta() == {"sha": sha, "tag": "v1"}
+
+
+def test_cache_is_keyed_on_local_head_not_git_sha(repo, tmp_path, monkeypatch):
+    head = _commit(repo)
+    _git("tag", "v1", cwd=repo)
+    monkeypatch.setenv("GIT_SHA", "0" * 40)
+
+    assert git_info.get_git_meta() == {"sha": "0" * 40, "tag": "v1"}
+    assert _cached(tmp_path)["sha"] == head